@@ -0,0 +1,236 @@
+import csv
+
+import numpy as np
+
+from walkthrough_patterns import GYM_TEAM_PATTERN
+
+#############################################
+# 1. TYPE CHART
+#############################################
+
+TYPES = [
+    "normal", "fire", "water", "electric", "grass", "ice", "fighting", "poison", "ground",
+    "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy"
+]
+TYPE_INDEX = {t: i for i, t in enumerate(TYPES)}
+
+# Attacking type -> (super effective against, not very effective against, no effect on)
+_TYPE_MATCHUPS = {
+    "normal": ([], ["rock", "steel"], ["ghost"]),
+    "fire": (["grass", "ice", "bug", "steel"], ["fire", "water", "rock", "dragon"], []),
+    "water": (["fire", "ground", "rock"], ["water", "grass", "dragon"], []),
+    "electric": (["water", "flying"], ["electric", "grass", "dragon"], ["ground"]),
+    "grass": (["water", "ground", "rock"], ["fire", "grass", "poison", "flying", "bug", "dragon", "steel"], []),
+    "ice": (["grass", "ground", "flying", "dragon"], ["fire", "water", "ice", "steel"], []),
+    "fighting": (["normal", "ice", "rock", "dark", "steel"], ["poison", "flying", "psychic", "bug", "fairy"], ["ghost"]),
+    "poison": (["grass", "fairy"], ["poison", "ground", "rock", "ghost"], ["steel"]),
+    "ground": (["fire", "electric", "poison", "rock", "steel"], ["grass", "bug"], ["flying"]),
+    "flying": (["grass", "fighting", "bug"], ["electric", "rock", "steel"], []),
+    "psychic": (["fighting", "poison"], ["psychic", "steel"], ["dark"]),
+    "bug": (["grass", "psychic", "dark"], ["fire", "fighting", "poison", "flying", "ghost", "steel", "fairy"], []),
+    "rock": (["fire", "ice", "flying", "bug"], ["fighting", "ground", "steel"], []),
+    "ghost": (["psychic", "ghost"], ["dark"], ["normal"]),
+    "dragon": (["dragon"], ["steel"], ["fairy"]),
+    "dark": (["psychic", "ghost"], ["fighting", "dark", "fairy"], []),
+    "steel": (["ice", "rock", "fairy"], ["fire", "water", "electric", "steel"], []),
+    "fairy": (["fighting", "dragon", "dark"], ["fire", "poison", "steel"], []),
+}
+
+def build_type_chart():
+    """
+    Returns an 18x18 array where chart[attacking, defending] is the damage multiplier.
+    """
+    chart = np.ones((len(TYPES), len(TYPES)))
+    for attacking, (strong, weak, immune) in _TYPE_MATCHUPS.items():
+        a = TYPE_INDEX[attacking]
+        for t in strong:
+            chart[a, TYPE_INDEX[t]] = 2.0
+        for t in weak:
+            chart[a, TYPE_INDEX[t]] = 0.5
+        for t in immune:
+            chart[a, TYPE_INDEX[t]] = 0.0
+    return chart
+
+TYPE_CHART = build_type_chart()
+
+def type_multiplier(attacker_types, defender_types):
+    """
+    Best multiplier the attacker can get out of any of its own types (assumes a
+    same-type move is always available), against all of the defender's types.
+    """
+    best = 0.0
+    for a in attacker_types:
+        if a not in TYPE_INDEX:
+            continue
+        m = 1.0
+        for d in defender_types:
+            if d in TYPE_INDEX:
+                m *= TYPE_CHART[TYPE_INDEX[a], TYPE_INDEX[d]]
+        best = max(best, m)
+    return best if attacker_types else 1.0
+
+#############################################
+# 2. TEAM PREPARATION
+#############################################
+
+def parse_stats(stats_str):
+    """
+    Turns "hp:45, attack:49, ..." (the all_pokemon_data.csv format) into a dict of ints.
+    """
+    stats = {}
+    for part in stats_str.split(","):
+        if ":" in part:
+            name, value = part.split(":", 1)
+            stats[name.strip()] = int(value.strip())
+    return stats
+
+def parse_types(types_str):
+    return [t.strip().lower() for t in types_str.split(",") if t.strip()]
+
+def scale_stat(base, level, is_hp=False):
+    """
+    Standard stat formula without IVs/EVs/nature.
+    """
+    value = (2 * base * level) // 100
+    return value + level + 10 if is_hp else value + 5
+
+def player_member(pokemon, level):
+    """
+    Converts a row of all_pokemon_data.csv into a battler scaled to the given level.
+    The better of attack/special-attack and defense/special-defense is used, since the
+    walkthrough gym data does not split physical and special stats.
+    """
+    stats = parse_stats(pokemon['stats'])
+    return {
+        "name": pokemon['name'],
+        "types": parse_types(pokemon['types']),
+        "level": level,
+        "hp": scale_stat(stats.get("hp", 1), level, is_hp=True),
+        "attack": scale_stat(max(stats.get("attack", 1), stats.get("special-attack", 1)), level),
+        "defense": scale_stat(max(stats.get("defense", 1), stats.get("special-defense", 1)), level),
+        "speed": scale_stat(stats.get("speed", 1), level),
+    }
+
+def load_gym_teams(filename="complete_dataset.csv", pokemon_data=None):
+    """
+    Reads the walkthrough dataset and returns a list of gyms:
+    {"name": ..., "team": [battler, ...]}. Types are looked up by species name in
+    pokemon_data (rows of all_pokemon_data.csv) when provided.
+    """
+    types_by_name = {}
+    for p in pokemon_data or []:
+        types_by_name[p['name'].lower()] = parse_types(p['types'])
+
+    gyms = []
+    try:
+        with open(filename, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                team = []
+                for m in GYM_TEAM_PATTERN.finditer(row.get("Team Composition", "")):
+                    name = m.group("Pokemon").strip()
+                    team.append({
+                        "name": name,
+                        "types": types_by_name.get(name.lower(), []),
+                        "level": int(m.group("Level")),
+                        "hp": int(m.group("HP")),
+                        "attack": int(m.group("Attack")),
+                        "defense": int(m.group("Defense")),
+                        "speed": int(m.group("Speed")),
+                    })
+                if team:
+                    gyms.append({
+                        "name": f"{row['Game Title']} - {row['Stage/Section']} ({row['Gym Leader/Champion']})",
+                        "team": team
+                    })
+    except FileNotFoundError:
+        print(f"File '{filename}' not found.")
+    return gyms
+
+#############################################
+# 3. VECTORIZED BATTLE SIMULATION
+#############################################
+
+MOVE_POWER = 60
+# Battles still running after this many turns are counted as draws.
+MAX_TURNS = 200
+
+def damage_matrix(attackers, defenders):
+    """
+    Deterministic part of the damage formula for every attacker/defender pair,
+    before the 0.85-1.00 random roll.
+    """
+    dmg = np.zeros((len(attackers), len(defenders)))
+    for i, a in enumerate(attackers):
+        for j, d in enumerate(defenders):
+            base = ((2 * a["level"] / 5 + 2) * MOVE_POWER * a["attack"] / max(d["defense"], 1)) / 50 + 2
+            dmg[i, j] = base * 1.5 * type_multiplier(a["types"], d["types"])  # 1.5 = same-type bonus
+    return dmg
+
+def simulate_battles(player_team, gym_team, n_battles=20000, seed=None):
+    """
+    Runs n_battles single-move battles at once and returns the fractions
+    (won by the player, drawn). Each side sends out its Pokémon in order; every turn
+    the faster active Pokémon hits first (ties broken at random) and a fainted Pokémon
+    is replaced by the next one. A battle where neither active Pokémon can damage the
+    other (e.g. Normal against Ghost) ends as a draw.
+    """
+    if not player_team or not gym_team:
+        return 0.0, 0.0
+    rng = np.random.default_rng(seed)
+    n_p, n_g = len(player_team), len(gym_team)
+    dmg_pg = damage_matrix(player_team, gym_team)
+    dmg_gp = damage_matrix(gym_team, player_team)
+    speed_p = np.array([p["speed"] for p in player_team])
+    speed_g = np.array([g["speed"] for g in gym_team])
+
+    hp_p = np.tile(np.array([p["hp"] for p in player_team], dtype=float), (n_battles, 1))
+    hp_g = np.tile(np.array([g["hp"] for g in gym_team], dtype=float), (n_battles, 1))
+    idx_p = np.zeros(n_battles, dtype=int)
+    idx_g = np.zeros(n_battles, dtype=int)
+    draw = np.zeros(n_battles, dtype=bool)
+    rows = np.arange(n_battles)
+
+    for _ in range(MAX_TURNS):
+        active = (idx_p < n_p) & (idx_g < n_g) & ~draw
+        if not active.any():
+            break
+        r = rows[active]
+        ip, ig = idx_p[r], idx_g[r]
+        stalled = (dmg_pg[ip, ig] == 0) & (dmg_gp[ig, ip] == 0)
+        if stalled.any():
+            draw[r[stalled]] = True
+            r, ip, ig = r[~stalled], ip[~stalled], ig[~stalled]
+        hit_pg = dmg_pg[ip, ig] * rng.uniform(0.85, 1.0, len(r))
+        hit_gp = dmg_gp[ig, ip] * rng.uniform(0.85, 1.0, len(r))
+        sp, sg = speed_p[ip], speed_g[ig]
+        player_first = (sp > sg) | ((sp == sg) & (rng.random(len(r)) < 0.5))
+
+        # First attack
+        hp_g[r, ig] -= np.where(player_first, hit_pg, 0.0)
+        hp_p[r, ip] -= np.where(player_first, 0.0, hit_gp)
+        # Second attack, only if the slower side survived the first one
+        p_alive = hp_p[r, ip] > 0
+        g_alive = hp_g[r, ig] > 0
+        hp_p[r, ip] -= np.where(player_first & g_alive, hit_gp, 0.0)
+        hp_g[r, ig] -= np.where(~player_first & p_alive, hit_pg, 0.0)
+
+        idx_p[r] += hp_p[r, ip] <= 0
+        idx_g[r] += hp_g[r, ig] <= 0
+
+    won = idx_g >= n_g
+    undecided = (idx_p < n_p) & ~won
+    return float(np.mean(won)), float(np.mean(draw | undecided))
+
+def simulate_against_gyms(team, gyms, n_battles=20000, level=None, seed=None):
+    """
+    Estimates the win and draw probabilities of a team (rows of all_pokemon_data.csv)
+    against every gym, as a list of (gym, win_rate, draw_rate) in the same order as gyms.
+    The team is scaled to the gym's highest level unless a level is given.
+    """
+    results = []
+    for i, gym in enumerate(gyms):
+        gym_level = level or max(g["level"] for g in gym["team"])
+        player_team = [player_member(p, gym_level) for p in team]
+        gym_seed = None if seed is None else seed + i
+        results.append((gym,) + simulate_battles(player_team, gym["team"], n_battles, gym_seed))
+    return results
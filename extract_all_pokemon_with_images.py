@@ -2,6 +2,7 @@ import requests
 import csv
 import time
 import base64
+from pokedex_db import save_pokemon
 
 def get_all_pokemon(limit=1118, offset=0):
     """
@@ -77,3 +78,4 @@ if __name__ == "__main__":
     
     export_all_to_csv(all_pokemon_data)
     print("Todos los datos han sido exportados a 'all_pokemon_data.csv'")
+    save_pokemon(all_pokemon_data)
@@ -4,6 +4,8 @@ import csv
 from pdf2image import convert_from_path
 import pytesseract
 from PIL import Image
+from pokedex_db import save_walkthrough
+from walkthrough_patterns import WILD_POKEMON_PATTERN, GYM_TEAM_PATTERN
 
 # Adjust this path if Tesseract is not on your PATH
 # For example, on Windows you might need:
@@ -52,13 +54,9 @@ def parse_wild_pokemon(segment_text):
     Parse wild Pokémon details from the text segment.
     This regex is designed to capture entries like:
        "Zigzagoon (Lv.3-5, Routes around Rustboro City)"
-    Adjust the regex as needed for your OCR output.
+    Adjust WILD_POKEMON_PATTERN in walkthrough_patterns.py as needed for your OCR output.
     """
-    pattern = re.compile(
-        r"(?P<Name>[A-Za-z’\-\s]+)\s*\(Lv\.?\s*(?P<LevelRange>[\d\-]+)\s*,\s*(?P<Location>[^)]+)\)",
-        re.IGNORECASE
-    )
-    matches = pattern.finditer(segment_text)
+    matches = WILD_POKEMON_PATTERN.finditer(segment_text)
     wild_pokemon = []
     for m in matches:
         wild_pokemon.append({
@@ -75,13 +73,9 @@ def parse_gym_team(segment_text):
     Parse gym leader/champion team compositions.
     This regex looks for patterns such as:
        "Geodude (Lv.12: HP 30, Atk 35, Def 40, Spd 20)"
-    Adjust as needed.
+    Adjust GYM_TEAM_PATTERN in walkthrough_patterns.py as needed.
     """
-    pattern = re.compile(
-        r"(?P<Pokemon>[A-Za-z’\-\s]+)\s*\(Lv\.?\s*(?P<Level>\d+)\s*:\s*HP\s*(?P<HP>\d+),\s*Atk\s*(?P<Attack>\d+),\s*Def\s*(?P<Defense>\d+),\s*Spd\s*(?P<Speed>\d+)\)",
-        re.IGNORECASE
-    )
-    matches = pattern.finditer(segment_text)
+    matches = GYM_TEAM_PATTERN.finditer(segment_text)
     team = []
     for m in matches:
         team.append({
@@ -161,3 +155,4 @@ for pdf in pdf_files:
 output_csv = "complete_dataset.csv"
 write_to_csv(all_data, output_csv)
 print(f"Dataset written to {output_csv}")
+save_walkthrough(all_data)
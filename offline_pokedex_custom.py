@@ -4,6 +4,8 @@ import csv
 import base64
 from PIL import Image, ImageTk
 import io
+import sqlite3
+import pokedex_db
 
 #############################################
 # 1. GIF ANIMATION FUNCTIONS
@@ -83,8 +85,20 @@ class PokedexApp:
         self.root.title("Pokédex")
         self.mode = "opening"  # We start in opening mode
 
-        # Load all Pokémon data from the CSV file
-        self.data = load_pokemon_data("all_pokemon_data.csv")
+        # Use the SQLite database if it has been built and holds the Pokémon (see pokedex_db.py),
+        # otherwise load all Pokémon data from the CSV file
+        try:
+            db = pokedex_db.open_existing(pokedex_db.DEFAULT_DB)
+        except sqlite3.Error as e:
+            # e.g. this Python's SQLite was built without FTS5
+            print(f"Could not open '{pokedex_db.DEFAULT_DB}', using the CSV files instead: {e}")
+            db = None
+        if db and pokedex_db.has_pokemon(db):
+            self.db = db
+            self.data = []
+        else:
+            self.db = None
+            self.data = load_pokemon_data("all_pokemon_data.csv")
         
         # Create a canvas for our GUI. This canvas will hold everything.
         self.canvas = tk.Canvas(root, highlightthickness=0)
@@ -131,7 +145,14 @@ class PokedexApp:
         if not term:
             messagebox.showinfo("Input Needed", "Please enter a Pokémon name or ID.")
             return
-        pokemon = find_pokemon(self.data, term)
+        if self.db:
+            # Exact name/ID first, then the best full-text match on names and abilities
+            pokemon = pokedex_db.find_pokemon(self.db, term)
+            if not pokemon:
+                matches = pokedex_db.search_pokemon(self.db, term, limit=1)
+                pokemon = matches[0] if matches else None
+        else:
+            pokemon = find_pokemon(self.data, term)
         if not pokemon:
             messagebox.showerror("Not Found", "No Pokémon found with that name or ID.")
             return
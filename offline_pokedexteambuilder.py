@@ -4,6 +4,9 @@ import csv
 import base64
 from PIL import Image, ImageTk
 import io
+import sqlite3
+import pokedex_db
+from battle_simulator import load_gym_teams, simulate_against_gyms
 
 #############################################
 # 1. GIF ANIMATION FUNCTIONS
@@ -66,8 +69,27 @@ class PokedexApp:
         self.root = root
         self.root.title("Pokédex")
         self.mode = "opening"
-        self.data = load_pokemon_data("all_pokemon_data.csv")
         self.team = []
+        self.gym_odds_text = ""
+        # The database may hold only the Pokémon or only the walkthrough, so each
+        # falls back to its CSV file on its own
+        try:
+            db = pokedex_db.open_existing(pokedex_db.DEFAULT_DB)
+        except sqlite3.Error as e:
+            # e.g. this Python's SQLite was built without FTS5
+            print(f"Could not open '{pokedex_db.DEFAULT_DB}', using the CSV files instead: {e}")
+            db = None
+        if db and pokedex_db.has_pokemon(db):
+            self.db = db
+            self.data = []
+        else:
+            self.db = None
+            self.data = load_pokemon_data("all_pokemon_data.csv")
+        if db and pokedex_db.has_walkthrough(db):
+            self.gyms = pokedex_db.load_gym_teams(db, None if self.db else self.data)
+        else:
+            type_rows = pokedex_db.pokemon_types(self.db) if self.db else self.data
+            self.gyms = load_gym_teams("complete_dataset.csv", type_rows)
 
         self.canvas = tk.Canvas(root, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
@@ -96,7 +118,13 @@ class PokedexApp:
         if not term:
             messagebox.showinfo("Input Needed", "Please enter a Pokémon name or ID.")
             return
-        pokemon = find_pokemon(self.data, term)
+        if self.db:
+            pokemon = pokedex_db.find_pokemon(self.db, term)
+            if not pokemon:
+                matches = pokedex_db.search_pokemon(self.db, term, limit=1)
+                pokemon = matches[0] if matches else None
+        else:
+            pokemon = find_pokemon(self.data, term)
         if not pokemon:
             messagebox.showerror("Not Found", "No Pokémon found with that name or ID.")
             return
@@ -128,6 +156,9 @@ class PokedexApp:
         self.team_label = tk.Label(self.root, text="Team:", font=("Arial", 10), justify="left")
         self.canvas.create_window(self.bg_width // 2, self.bg_height - 30, window=self.team_label)
 
+        self.gym_odds_label = tk.Label(self.root, text=self.gym_odds_text, font=("Consolas", 8), justify="left")
+        self.canvas.create_window(self.bg_width - 10, 10, anchor="ne", window=self.gym_odds_label)
+
     def display_pokemon(self, pokemon):
         stats_str = pokemon['stats'].replace("special-attack", "SA").replace("special-defense", "SD")
         info_text = (
@@ -153,6 +184,25 @@ class PokedexApp:
             stats_str = p['stats'].replace("special-attack", "SA").replace("special-defense", "SD")
             team_text += f"{p['name']} (ID: {p['id']})\nTypes: {p['types']}\nStats: {stats_str}\n\n"
         self.team_label.config(text=team_text)
+        # Let the team label redraw before the simulation runs
+        self.gym_odds_label.config(text="Simulating gym battles...")
+        self.root.after(1, self.update_gym_odds)
+
+    def update_gym_odds(self):
+        # Only called when the team changes; show_pokedex_ui reuses the cached text
+        if not self.gyms:
+            self.gym_odds_text = "No gym teams found in 'complete_dataset.csv'."
+            self.gym_odds_label.config(text=self.gym_odds_text)
+            return
+        odds = simulate_against_gyms(self.team, self.gyms, n_battles=20000)
+        odds_text = "Win chance vs gyms:\n"
+        for i, (gym, win_rate, draw_rate) in enumerate(odds, start=1):
+            odds_text += f"{i}. {gym['name']}: {win_rate:.0%}"
+            if draw_rate:
+                odds_text += f" (draw {draw_rate:.0%})"
+            odds_text += "\n"
+        self.gym_odds_text = odds_text
+        self.gym_odds_label.config(text=self.gym_odds_text)
 
 #############################################
 # 4. RUN THE APPLICATION
@@ -0,0 +1,319 @@
+import csv
+import os
+import re
+import sqlite3
+
+from walkthrough_patterns import WILD_POKEMON_PATTERN, GYM_TEAM_PATTERN
+
+#############################################
+# 1. SCHEMA
+#############################################
+
+DEFAULT_DB = "pokedex.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pokemon (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    image_base64 TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS pokemon_types (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id) ON DELETE CASCADE,
+    type_id INTEGER NOT NULL REFERENCES types(id),
+    slot INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, slot)
+);
+CREATE INDEX IF NOT EXISTS idx_pokemon_types_type ON pokemon_types(type_id);
+CREATE TABLE IF NOT EXISTS abilities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS pokemon_abilities (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id) ON DELETE CASCADE,
+    ability_id INTEGER NOT NULL REFERENCES abilities(id),
+    slot INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, slot)
+);
+CREATE INDEX IF NOT EXISTS idx_pokemon_abilities_ability ON pokemon_abilities(ability_id);
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS pokemon_stats (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id) ON DELETE CASCADE,
+    stat_id INTEGER NOT NULL REFERENCES stats(id),
+    base_stat INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, stat_id)
+);
+CREATE INDEX IF NOT EXISTS idx_pokemon_stats_stat ON pokemon_stats(stat_id, base_stat);
+CREATE TABLE IF NOT EXISTS walkthrough_sections (
+    id INTEGER PRIMARY KEY,
+    game_title TEXT NOT NULL,
+    region TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    leader TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_sections_game ON walkthrough_sections(game_title);
+CREATE TABLE IF NOT EXISTS encounters (
+    id INTEGER PRIMARY KEY,
+    section_id INTEGER NOT NULL REFERENCES walkthrough_sections(id) ON DELETE CASCADE,
+    pokemon_name TEXT NOT NULL COLLATE NOCASE,
+    level_range TEXT NOT NULL,
+    location TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_encounters_pokemon ON encounters(pokemon_name);
+CREATE INDEX IF NOT EXISTS idx_encounters_section ON encounters(section_id);
+CREATE TABLE IF NOT EXISTS trainer_team_members (
+    section_id INTEGER NOT NULL REFERENCES walkthrough_sections(id) ON DELETE CASCADE,
+    slot INTEGER NOT NULL,
+    pokemon_name TEXT NOT NULL COLLATE NOCASE,
+    level INTEGER NOT NULL,
+    hp INTEGER NOT NULL,
+    attack INTEGER NOT NULL,
+    defense INTEGER NOT NULL,
+    speed INTEGER NOT NULL,
+    PRIMARY KEY (section_id, slot)
+);
+CREATE INDEX IF NOT EXISTS idx_team_members_pokemon ON trainer_team_members(pokemon_name);
+CREATE VIRTUAL TABLE IF NOT EXISTS pokemon_fts USING fts5(name, abilities);
+CREATE VIRTUAL TABLE IF NOT EXISTS walkthrough_fts USING fts5(stage, leader, notes);
+"""
+
+def connect(filename=DEFAULT_DB):
+    """
+    Opens (and creates, if needed) the SQLite database.
+    """
+    conn = sqlite3.connect(filename)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+def open_existing(filename=DEFAULT_DB):
+    """
+    Opens the database only if it has already been built, otherwise returns None
+    so the apps can keep using the CSV files.
+    """
+    if not os.path.exists(filename):
+        return None
+    return connect(filename)
+
+#############################################
+# 2. BULK LOADING
+#############################################
+
+def _split_list(value):
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+def _lookup_ids(conn, table, names):
+    """
+    Inserts any missing names into a lookup table (keeping their order) and returns {name: id}.
+    """
+    conn.executemany(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", [(n,) for n in names])
+    return {row["name"]: row["id"] for row in conn.execute(f"SELECT id, name FROM {table}")}
+
+def save_pokemon(pokemon_list, filename=DEFAULT_DB):
+    """
+    Replaces the Pokémon tables with the given list of dicts, in the format produced by
+    get_pokemon_data() in extract_all_pokemon_with_images.py (also the rows of all_pokemon_data.csv).
+    """
+    conn = connect(filename)
+    with conn:
+        conn.execute("DELETE FROM pokemon")
+        conn.execute("DELETE FROM pokemon_fts")
+
+        parsed = []
+        for p in pokemon_list:
+            stats = [s.split(":", 1) for s in _split_list(p['stats']) if ":" in s]
+            parsed.append((int(p['id']), p['name'], _split_list(p['types']), _split_list(p['abilities']),
+                           [(name.strip(), int(value)) for name, value in stats], p.get('image_base64', '')))
+
+        type_ids = _lookup_ids(conn, "types", dict.fromkeys(t for p in parsed for t in p[2]))
+        ability_ids = _lookup_ids(conn, "abilities", dict.fromkeys(a for p in parsed for a in p[3]))
+        stat_ids = _lookup_ids(conn, "stats", dict.fromkeys(s for p in parsed for s, _ in p[4]))
+
+        conn.executemany("INSERT INTO pokemon (id, name, image_base64) VALUES (?, ?, ?)",
+                         [(pid, name, image) for pid, name, _, _, _, image in parsed])
+        conn.executemany("INSERT INTO pokemon_types (pokemon_id, type_id, slot) VALUES (?, ?, ?)",
+                         [(p[0], type_ids[t], slot) for p in parsed for slot, t in enumerate(p[2])])
+        conn.executemany("INSERT INTO pokemon_abilities (pokemon_id, ability_id, slot) VALUES (?, ?, ?)",
+                         [(p[0], ability_ids[a], slot) for p in parsed for slot, a in enumerate(p[3])])
+        conn.executemany("INSERT INTO pokemon_stats (pokemon_id, stat_id, base_stat) VALUES (?, ?, ?)",
+                         [(p[0], stat_ids[s], v) for p in parsed for s, v in p[4]])
+        conn.executemany("INSERT INTO pokemon_fts (rowid, name, abilities) VALUES (?, ?, ?)",
+                         [(p[0], p[1], " ".join(p[3])) for p in parsed])
+    conn.close()
+    print(f"Saved {len(pokemon_list)} Pokémon to '{filename}'.")
+
+def save_walkthrough(data, filename=DEFAULT_DB):
+    """
+    Replaces the walkthrough tables with the given rows, in the format produced by
+    process_pdf() in extract_walkthroughpdf.py (also the rows of complete_dataset.csv).
+    """
+    conn = connect(filename)
+    with conn:
+        conn.execute("DELETE FROM walkthrough_sections")
+        conn.execute("DELETE FROM walkthrough_fts")
+
+        sections, encounters, members = [], [], []
+        for section_id, row in enumerate(data, start=1):
+            sections.append((section_id, row["Game Title"], row["Region"], row["Stage/Section"],
+                             row["Gym Leader/Champion"], row["Additional Notes/Strategy"]))
+            for m in WILD_POKEMON_PATTERN.finditer(row["Available Wild Pokémon"]):
+                encounters.append((section_id, m.group("Name").strip(), m.group("LevelRange").strip(),
+                                   m.group("Location").strip()))
+            for slot, m in enumerate(GYM_TEAM_PATTERN.finditer(row["Team Composition"])):
+                members.append((section_id, slot, m.group("Pokemon").strip(), int(m.group("Level")),
+                                int(m.group("HP")), int(m.group("Attack")), int(m.group("Defense")),
+                                int(m.group("Speed"))))
+
+        conn.executemany("INSERT INTO walkthrough_sections (id, game_title, region, stage, leader, notes) "
+                         "VALUES (?, ?, ?, ?, ?, ?)", sections)
+        conn.executemany("INSERT INTO encounters (section_id, pokemon_name, level_range, location) "
+                         "VALUES (?, ?, ?, ?)", encounters)
+        conn.executemany("INSERT INTO trainer_team_members (section_id, slot, pokemon_name, level, hp, attack, "
+                         "defense, speed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", members)
+        conn.executemany("INSERT INTO walkthrough_fts (rowid, stage, leader, notes) VALUES (?, ?, ?, ?)",
+                         [(s[0], s[3], s[4], s[5]) for s in sections])
+    conn.close()
+    print(f"Saved {len(data)} walkthrough sections to '{filename}'.")
+
+#############################################
+# 3. QUERIES
+#############################################
+
+# Rebuilds the all_pokemon_data.csv row format so the apps can use either backend.
+POKEMON_ROW_QUERY = """
+SELECT p.name, CAST(p.id AS TEXT) AS id,
+       (SELECT group_concat(name, ', ') FROM (
+            SELECT t.name FROM pokemon_types pt JOIN types t ON t.id = pt.type_id
+            WHERE pt.pokemon_id = p.id ORDER BY pt.slot)) AS types,
+       (SELECT group_concat(stat, ', ') FROM (
+            SELECT s.name || ':' || ps.base_stat AS stat FROM pokemon_stats ps JOIN stats s ON s.id = ps.stat_id
+            WHERE ps.pokemon_id = p.id ORDER BY s.id)) AS stats,
+       (SELECT group_concat(name, ', ') FROM (
+            SELECT a.name FROM pokemon_abilities pa JOIN abilities a ON a.id = pa.ability_id
+            WHERE pa.pokemon_id = p.id ORDER BY pa.slot)) AS abilities,
+       p.image_base64
+FROM pokemon p
+"""
+
+def _pokemon_row(row):
+    pokemon = dict(row)
+    for key in ('types', 'stats', 'abilities'):
+        pokemon[key] = pokemon[key] or ""
+    return pokemon
+
+def find_pokemon(conn, search_term):
+    """
+    Exact (case-insensitive) name or ID lookup, same rules as find_pokemon() in the apps.
+    """
+    if search_term.isdigit():
+        row = conn.execute(POKEMON_ROW_QUERY + " WHERE p.id = ?", (int(search_term),)).fetchone()
+    else:
+        row = conn.execute(POKEMON_ROW_QUERY + " WHERE p.name = ?", (search_term,)).fetchone()
+    return _pokemon_row(row) if row else None
+
+def _fts_query(text):
+    """
+    Turns free text into an FTS5 prefix query, quoting each word so user input
+    cannot inject FTS syntax.
+    """
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{w}"*' for w in words)
+
+def search_pokemon(conn, text, limit=10):
+    """
+    Full-text search over Pokémon names and abilities, best matches first.
+    """
+    query = _fts_query(text)
+    if not query:
+        return []
+    rows = conn.execute(POKEMON_ROW_QUERY + " JOIN pokemon_fts f ON f.rowid = p.id "
+                        "WHERE pokemon_fts MATCH ? ORDER BY f.rank LIMIT ?", (query, limit))
+    return [_pokemon_row(r) for r in rows]
+
+def search_walkthrough(conn, text, limit=10):
+    """
+    Full-text search over walkthrough section headings, leaders and notes.
+    """
+    query = _fts_query(text)
+    if not query:
+        return []
+    rows = conn.execute("SELECT s.* FROM walkthrough_fts f JOIN walkthrough_sections s ON s.id = f.rowid "
+                        "WHERE walkthrough_fts MATCH ? ORDER BY f.rank LIMIT ?", (query, limit))
+    return [dict(r) for r in rows]
+
+def find_encounters(conn, pokemon_name):
+    """
+    Where a Pokémon can be caught, across all walkthrough sections.
+    """
+    rows = conn.execute("SELECT s.game_title, s.region, s.stage, e.level_range, e.location "
+                        "FROM encounters e JOIN walkthrough_sections s ON s.id = e.section_id "
+                        "WHERE e.pokemon_name = ? ORDER BY s.id", (pokemon_name,))
+    return [dict(r) for r in rows]
+
+def has_pokemon(conn):
+    return conn.execute("SELECT 1 FROM pokemon LIMIT 1").fetchone() is not None
+
+def has_walkthrough(conn):
+    return conn.execute("SELECT 1 FROM walkthrough_sections LIMIT 1").fetchone() is not None
+
+def pokemon_types(conn):
+    """
+    Just the name and types of every Pokémon, as rows in the all_pokemon_data.csv format.
+    """
+    rows = conn.execute("""
+        SELECT p.name, (SELECT group_concat(name, ', ') FROM (
+                            SELECT t.name FROM pokemon_types pt JOIN types t ON t.id = pt.type_id
+                            WHERE pt.pokemon_id = p.id ORDER BY pt.slot)) AS types
+        FROM pokemon p
+    """)
+    return [{"name": r["name"], "types": r["types"] or ""} for r in rows]
+
+def load_gym_teams(conn, pokemon_data=None):
+    """
+    Same output as battle_simulator.load_gym_teams(), read from the database.
+    Types come from the pokemon table, or from pokemon_data (rows of
+    all_pokemon_data.csv) when the Pokémon are not stored in the database.
+    """
+    types_by_name = {p['name'].lower(): p['types'] for p in pokemon_data or []}
+    gyms = {}
+    rows = conn.execute("""
+        SELECT s.id, s.game_title, s.stage, s.leader, m.pokemon_name, m.level, m.hp, m.attack, m.defense, m.speed,
+               (SELECT group_concat(name, ', ') FROM (
+                    SELECT t.name FROM pokemon p
+                    JOIN pokemon_types pt ON pt.pokemon_id = p.id JOIN types t ON t.id = pt.type_id
+                    WHERE p.name = m.pokemon_name ORDER BY pt.slot)) AS types
+        FROM trainer_team_members m JOIN walkthrough_sections s ON s.id = m.section_id
+        ORDER BY s.id, m.slot
+    """)
+    for r in rows:
+        gym = gyms.setdefault(r["id"], {"name": f"{r['game_title']} - {r['stage']} ({r['leader']})", "team": []})
+        gym["team"].append({
+            "name": r["pokemon_name"],
+            "types": _split_list(types_by_name.get(r["pokemon_name"].lower(), r["types"]) or ""),
+            "level": r["level"],
+            "hp": r["hp"],
+            "attack": r["attack"],
+            "defense": r["defense"],
+            "speed": r["speed"],
+        })
+    return list(gyms.values())
+
+#############################################
+# 4. BUILD THE DATABASE FROM THE EXISTING CSV FILES
+#############################################
+
+def read_csv(filename):
+    with open(filename, newline='', encoding='utf-8') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+if __name__ == "__main__":
+    save_pokemon(read_csv("all_pokemon_data.csv"))
+    save_walkthrough(read_csv("complete_dataset.csv"))
@@ -0,0 +1,58 @@
+import pytest
+
+from battle_simulator import (
+    player_member, scale_stat, simulate_against_gyms, simulate_battles, type_multiplier
+)
+
+def battler(types, hp=50, attack=30, defense=30, speed=30, level=15):
+    return {"name": "x", "types": types, "level": level, "hp": hp,
+            "attack": attack, "defense": defense, "speed": speed}
+
+PIKACHU = {"name": "pikachu", "id": "25", "types": "electric",
+           "stats": "hp:35, attack:55, defense:40, special-attack:50, special-defense:50, speed:90"}
+
+@pytest.mark.parametrize("attacker, defender, expected", [
+    (["water"], ["fire"], 2.0),
+    (["fire"], ["water"], 0.5),
+    (["electric"], ["ground"], 0.0),
+    (["normal"], ["ghost"], 0.0),
+    (["water"], ["rock", "ground"], 4.0),
+    (["grass", "poison"], ["water"], 2.0),  # best of the attacker's types
+    ([], ["fire"], 1.0),
+])
+def test_type_multiplier(attacker, defender, expected):
+    assert type_multiplier(attacker, defender) == expected
+
+def test_scale_stat():
+    assert scale_stat(100, 50) == 105
+    assert scale_stat(100, 50, is_hp=True) == 160
+    assert scale_stat(35, 100, is_hp=True) == 180
+
+def test_player_member_uses_better_physical_or_special_stat():
+    member = player_member(PIKACHU, 50)
+    assert member["types"] == ["electric"]
+    assert member["hp"] == scale_stat(35, 50, is_hp=True)
+    assert member["attack"] == scale_stat(55, 50)
+    assert member["defense"] == scale_stat(50, 50)
+
+def test_simulate_battles_is_deterministic_with_seed():
+    player = [battler(["water"]), battler(["grass"])]
+    gym = [battler(["fire"], speed=40), battler(["rock"], hp=60)]
+    first = simulate_battles(player, gym, n_battles=2000, seed=7)
+    assert first == simulate_battles(player, gym, n_battles=2000, seed=7)
+    assert 0.0 <= first[0] <= 1.0
+
+def test_simulate_battles_type_advantage_wins():
+    win, draw = simulate_battles([battler(["water"])], [battler(["fire"])], n_battles=1000, seed=1)
+    assert win == 1.0 and draw == 0.0
+
+def test_simulate_battles_stalemate_is_a_draw():
+    win, draw = simulate_battles([battler(["normal"])], [battler(["ghost"])], n_battles=1000, seed=1)
+    assert (win, draw) == (0.0, 1.0)
+
+def test_simulate_against_gyms_keeps_gyms_with_the_same_name():
+    gyms = [{"name": "Before Gym (Unknown)", "team": [battler(["ground"])]},
+            {"name": "Before Gym (Unknown)", "team": [battler(["water"])]}]
+    results = simulate_against_gyms([PIKACHU], gyms, n_battles=500, seed=1)
+    assert [gym for gym, _, _ in results] == gyms
+    assert results[0][1] < results[1][1]
@@ -0,0 +1,76 @@
+import csv
+import os
+
+import pytest
+
+import battle_simulator
+import pokedex_db
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+POKEMON = pokedex_db.read_csv(os.path.join(ROOT, "all_pokemon_data.csv"))[:200]
+
+WALKTHROUGH = [
+    {"Game Title": "Pokémon FireRed/LeafGreen", "Region": "Kanto", "Stage/Section": "Gym Battle 1",
+     "Available Wild Pokémon": "Pidgey (Lv.2-5, Route 1); Rattata (Lv.2-4, Route 1)",
+     "Gym Leader/Champion": "Brock",
+     "Team Composition": "Geodude (Lv.12: HP 30, Atk 35, Def 40, Spd 20); Onix (Lv.14: HP 40, Atk 30, Def 80, Spd 35)",
+     "Additional Notes/Strategy": "Rock types, bring a Water or Grass Pokémon"},
+    {"Game Title": "Pokémon FireRed/LeafGreen", "Region": "Kanto", "Stage/Section": "Before Gym",
+     "Available Wild Pokémon": "", "Gym Leader/Champion": "Unknown",
+     "Team Composition": "Bulbasaur (Lv.5: HP 20, Atk 10, Def 10, Spd 10)",
+     "Additional Notes/Strategy": "Rival battle in the lab"},
+    {"Game Title": "Pokémon FireRed/LeafGreen", "Region": "Kanto", "Stage/Section": "Before Gym",
+     "Available Wild Pokémon": "", "Gym Leader/Champion": "Unknown",
+     "Team Composition": "Ivysaur (Lv.20: HP 50, Atk 30, Def 30, Spd 25)",
+     "Additional Notes/Strategy": ""},
+]
+
+@pytest.fixture
+def conn(tmp_path):
+    filename = str(tmp_path / "pokedex.db")
+    pokedex_db.save_pokemon(POKEMON, filename)
+    pokedex_db.save_walkthrough(WALKTHROUGH, filename)
+    conn = pokedex_db.connect(filename)
+    yield conn
+    conn.close()
+
+def test_find_pokemon_matches_csv_rows(conn):
+    for row in POKEMON:
+        assert pokedex_db.find_pokemon(conn, row['name']) == row
+        assert pokedex_db.find_pokemon(conn, row['id']) == row
+    assert pokedex_db.find_pokemon(conn, "PIKACHU")['name'] == "pikachu"
+    assert pokedex_db.find_pokemon(conn, "missingno") is None
+
+def test_search_pokemon(conn):
+    assert pokedex_db.search_pokemon(conn, "pikac")[0]['name'] == "pikachu"
+    assert "bulbasaur" in [p['name'] for p in pokedex_db.search_pokemon(conn, "overgrow")]
+    assert pokedex_db.search_pokemon(conn, '" OR *') == []
+
+def test_walkthrough_queries(conn):
+    assert [s['leader'] for s in pokedex_db.search_walkthrough(conn, "grass")] == ["Brock"]
+    assert pokedex_db.find_encounters(conn, "pidgey") == [
+        {"game_title": "Pokémon FireRed/LeafGreen", "region": "Kanto", "stage": "Gym Battle 1",
+         "level_range": "2-5", "location": "Route 1"}]
+
+def test_load_gym_teams_matches_csv_path(conn, tmp_path):
+    csv_path = tmp_path / "complete_dataset.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(WALKTHROUGH[0]))
+        writer.writeheader()
+        writer.writerows(WALKTHROUGH)
+
+    from_db = pokedex_db.load_gym_teams(conn)
+    assert from_db == battle_simulator.load_gym_teams(str(csv_path), POKEMON)
+    # Gyms sharing a name are kept apart
+    assert len(from_db) == 3
+    assert from_db[0]['team'][0]['types'] == ["rock", "ground"]
+
+def test_partially_built_database(tmp_path):
+    filename = str(tmp_path / "pokedex.db")
+    assert pokedex_db.open_existing(filename) is None
+    pokedex_db.save_walkthrough(WALKTHROUGH, filename)
+    conn = pokedex_db.open_existing(filename)
+    assert pokedex_db.has_walkthrough(conn) and not pokedex_db.has_pokemon(conn)
+    gyms = pokedex_db.load_gym_teams(conn, POKEMON)
+    assert gyms[0]['team'][1]['types'] == ["rock", "ground"]
+    conn.close()
@@ -0,0 +1,17 @@
+import re
+
+# Regexes for the walkthrough entries, shared by the OCR parser (extract_walkthroughpdf.py),
+# which reads them from the guide text, and by everything that reads complete_dataset.csv,
+# where process_pdf() writes them back in the same format joined with "; ".
+
+# "Zigzagoon (Lv.3-5, Routes around Rustboro City)"
+WILD_POKEMON_PATTERN = re.compile(
+    r"(?P<Name>[A-Za-z’\-\s]+)\s*\(Lv\.?\s*(?P<LevelRange>[\d\-]+)\s*,\s*(?P<Location>[^)]+)\)",
+    re.IGNORECASE
+)
+
+# "Geodude (Lv.12: HP 30, Atk 35, Def 40, Spd 20)"
+GYM_TEAM_PATTERN = re.compile(
+    r"(?P<Pokemon>[A-Za-z’\-\s]+)\s*\(Lv\.?\s*(?P<Level>\d+)\s*:\s*HP\s*(?P<HP>\d+),\s*Atk\s*(?P<Attack>\d+),\s*Def\s*(?P<Defense>\d+),\s*Spd\s*(?P<Speed>\d+)\)",
+    re.IGNORECASE
+)